@@ -13,7 +13,6 @@ MengLong SDK Demo
 """
 
 import argparse
-import json
 
 from menglong import Model, Context, Assistant, Tool, tool
 
@@ -55,6 +54,14 @@ def calculate(expression: str) -> str:
         return f"Error: {e}"
 
 
+TOOLS = [get_weather, calculate]
+TOOL_MAP = {t.__name__: t for t in TOOLS}
+
+# 多个 demo 共用的系统提示，集中定义避免重复书写
+BRIEF_SYSTEM_PROMPT = "你是一位简洁友好的 AI 助手，回复请控制在 2 句话以内。"
+TOOL_SYSTEM_PROMPT = "你是一位使用工具解决问题的 AI 助手。"
+
+
 # =============================================================================
 #  演示函数
 # =============================================================================
@@ -67,7 +74,7 @@ def demo_chat(model: Model):
     print("=" * 50)
 
     ctx = Context()
-    ctx.system("你是一位简洁友好的 AI 助手，回复请控制在 2 句话以内。")
+    ctx.system(BRIEF_SYSTEM_PROMPT)
     ctx.user("你好，你是谁？")
 
     response = model.chat(messages=ctx)
@@ -81,7 +88,7 @@ def demo_stream(model: Model):
     print("=" * 50)
 
     ctx = Context()
-    ctx.system("你是一位简洁友好的 AI 助手，回复请控制在 2 句话以内。")
+    ctx.system(BRIEF_SYSTEM_PROMPT)
     ctx.user("用一句话介绍一下你自己。")
 
     print("[assistant] ", end="", flush=True)
@@ -100,8 +107,6 @@ def demo_tool(model: Model):
     print("  🛠️   工具调用（Tool Call）")
     print("=" * 50)
 
-    tools = [get_weather, calculate]
-
     # ── 测试用例列表 ──────────────────────────────────────────────
     test_cases = [
         "你是谁？上海今天的天气怎么样？",
@@ -112,33 +117,34 @@ def demo_tool(model: Model):
         print(f"\n[user] {prompt}")
 
         ctx = Context()
-        ctx.system("你是一位使用工具解决问题的 AI 助手。")
+        ctx.system(TOOL_SYSTEM_PROMPT)
         ctx.user(prompt)
 
         # 第一轮：获取工具调用建议
-        response = model.chat(messages=ctx, tools=tools)
+        response = model.chat(messages=ctx, tools=TOOLS)
+        tool_calls = response.tool_calls
+        text = response.text
 
-        if not response.tool_calls:
-            print(f"[assistant] {response.text}")
+        if not tool_calls:
+            print(f"[assistant] {text}")
             continue
 
         # 把 assistant 工具请求写回 Context
         ctx.add(
             Assistant(
-                content=response.text,
-                actions=[tc.model_dump() for tc in response.tool_calls],
+                content=text,
+                actions=[tc.model_dump() for tc in tool_calls],
             )
         )
 
         # 执行工具并写回结果
-        tool_map = {get_weather.__name__: get_weather, calculate.__name__: calculate}
-        for tc in response.tool_calls:
-            func = tool_map.get(tc.name)
+        for tc in tool_calls:
+            func = TOOL_MAP.get(tc.name)
             if func:
                 result = func(**tc.arguments)
                 print(f"  → 调用工具 [{tc.name}]，参数: {tc.arguments}")
                 print(f"  ← 工具结果: {result}")
-                ctx.tool(tool_id=tc.id, content=json.dumps(result, ensure_ascii=False))
+                ctx.tool(tool_id=tc.id, content=result)
 
         # 第二轮：获取最终回答
         final = model.chat(messages=ctx)
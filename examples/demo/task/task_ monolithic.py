@@ -1,9 +1,13 @@
 import asyncio
+import functools
 import json
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from enum import Enum
 import heapq
+import itertools
+from collections import deque
 
 from prompt_toolkit import Application
 from prompt_toolkit.key_binding import KeyBindings
@@ -13,6 +17,51 @@ from prompt_toolkit.widgets import TextArea, Frame
 from prompt_toolkit.filters import has_focus
 
 
+# 输出区最多保留的输出条数，超出后丢弃最早的输出，避免长时间运行时文本无限增长
+MAX_OUTPUT_ENTRIES = 500
+
+# 调度器状态输出模板，字段与 TaskScheduler.get_queue_status() 的键一致
+SCHEDULER_STATUS_TEMPLATE = """调度器状态:
+- 队列中任务: {queue_size}
+- 运行中任务: {running_tasks}
+- 已完成任务: {completed_tasks}
+- 已取消任务: {cancelled_tasks}"""
+
+# help 命令输出的帮助文本
+HELP_TEXT = """可用命令:
+- send <优先级> <任务内容>  : 发送指定优先级的任务
+  优先级: critical, high, normal, low
+  例如: send high 重要数据处理
+- <任务内容>               : 发送普通优先级任务
+- status <任务ID>          : 查看任务状态
+- cancel <任务ID>          : 取消任务
+- suspend <任务ID>         : 挂起任务
+- resume <任务ID>          : 恢复挂起的任务
+- list                    : 列出所有任务
+- scheduler               : 查看调度器状态
+- demo                    : 运行演示，创建各种优先级的示例任务
+- demo-states             : 运行状态演示，展示任务状态转换
+- clear                   : 清空输出
+- help                    : 显示此帮助
+- Ctrl+C                  : 退出程序
+
+优先级说明:
+- critical: 关键任务，会打断其他所有任务
+- high: 高优先级，在系统繁忙时可能打断低优先级任务
+- normal: 普通优先级 (默认)
+- low: 低优先级
+
+任务状态说明:
+- UNUSED: 默认初始化状态
+- READY: 准备就绪，等待调度
+- RUNNING: 正在运行
+- WAITING: 等待依赖任务完成
+- SUSPENDED: 已挂起，等待恢复
+- CANCELED: 已取消
+- COMPLETED: 已完成
+- ERROR: 出现错误"""
+
+
 class Priority(Enum):
     """任务优先级枚举"""
 
@@ -22,6 +71,20 @@ class Priority(Enum):
     LOW = 3  # 低优先级
 
 
+# send 命令中的优先级名称 -> 枚举成员
+PRIORITY_BY_NAME = {p.name.lower(): p for p in Priority}
+
+# list 命令中任务状态 (status) 的图标
+STATUS_ICONS = {
+    "queued": "⏳",
+    "running": "🔄",
+    "completed": "✅",
+    "cancelled": "❌",
+    "failed": "💥",
+    "suspended": "⏸️",
+}
+
+
 class TaskState(Enum):
     """任务状态枚举"""
 
@@ -35,9 +98,35 @@ class TaskState(Enum):
     ERROR = "ERROR"  # 错误状态（任务出现未知情况，标记为错误状态）
 
 
+# list 命令中任务状态机状态 (state) 的图标
+STATE_ICONS = {
+    "UNUSED": "🔘",
+    "READY": "⏳",
+    "RUNNING": "🔄",
+    "WAITING": "⏱️",
+    "SUSPENDED": "⏸️",
+    "CANCELED": "❌",
+    "COMPLETED": "✅",
+    "ERROR": "💥",
+}
+
+
+# 可被调度的状态集合（枚举成员是单例，状态判断统一用 is / 集合成员测试）
+SCHEDULABLE_STATES = frozenset(
+    {
+        TaskState.UNUSED,
+        TaskState.READY,
+        TaskState.SUSPENDED,
+    }
+)
+
+
 class TaskItem:
     """任务项，用于优先队列"""
 
+    # 固定属性集合，省去每个任务项的 __dict__，队列比较时属性访问也更快
+    __slots__ = ("task_id", "priority", "data", "timestamp", "state", "cancelled")
+
     def __init__(self, task_id: str, priority: Priority, data: str, timestamp: float):
         self.task_id = task_id
         self.priority = priority
@@ -46,61 +135,88 @@ class TaskItem:
         self.state = TaskState.UNUSED  # 初始状态为UNUSED
         self.cancelled = False
 
-    def __lt__(self, other):
-        # 优先级越小越优先，时间戳越小越优先
-        if self.priority.value != other.priority.value:
-            return self.priority.value < other.priority.value
-        return self.timestamp < other.timestamp
-
     def set_state(self, new_state: TaskState):
         """设置任务状态"""
         self.state = new_state
 
     def is_ready(self) -> bool:
         """检查任务是否准备就绪"""
-        return self.state == TaskState.READY
+        return self.state is TaskState.READY
 
     def is_running(self) -> bool:
         """检查任务是否正在运行"""
-        return self.state == TaskState.RUNNING
+        return self.state is TaskState.RUNNING
 
     def is_completed(self) -> bool:
         """检查任务是否已完成"""
-        return self.state == TaskState.COMPLETED
+        return self.state is TaskState.COMPLETED
 
     def is_canceled(self) -> bool:
         """检查任务是否已取消"""
-        return self.state == TaskState.CANCELED
+        return self.state is TaskState.CANCELED
 
     def can_be_scheduled(self) -> bool:
         """检查任务是否可以被调度"""
-        return self.state in [
-            TaskState.UNUSED,
-            TaskState.READY,
-            TaskState.SUSPENDED,
-        ]
+        return self.state in SCHEDULABLE_STATES
 
 
 class TaskScheduler:
     """任务调度器，支持优先级和打断机制"""
 
     def __init__(self):
+        # 堆元素为 (优先级值, 时间戳, 序号, 任务项)：优先级越小越优先，时间戳越小越优先，
+        # 序号保证同优先级同时间戳时按入队顺序出队，且永远不会比较到任务项本身
         self.priority_queue = []
+        self._seq = itertools.count()
+        # task_id -> 队列中的任务项，与 priority_queue 同步维护，按 ID 查找无需扫描整个堆
+        self.queued_tasks: Dict[str, TaskItem] = {}
+        # 队列中已取消（但仍留在堆里）的任务数，用于 O(1) 计算有效队列长度
+        self._cancelled_in_queue = 0
         self.running_tasks = {}
-        self.suspend_tasks = set()  # 挂起的任务集合
         self.completed_tasks = {}
         self.cancelled_tasks = set()
         self.scheduler_running = False
+        # 调度唤醒事件：队列或运行状态变化时置位，调度循环只在有事可做时运行；
+        # 两次调度之间的多次置位合并为一轮处理
+        self._wakeup = asyncio.Event()
+        # 任务状态变化事件：监控方等待当前事件，状态变化时置位并换上新事件，
+        # 所有等待者一次性被唤醒，无需轮询
+        self._changed = asyncio.Event()
+        # 事件循环时钟（loop.time 绑定方法），首次使用时绑定
+        self._clock = None
+
+    def _now(self) -> float:
+        """返回事件循环的单调时钟读数"""
+        if self._clock is None:
+            # 调度器只在协程中使用，直接取当前运行的事件循环
+            self._clock = asyncio.get_running_loop().time
+        return self._clock()
+
+    def _notify(self):
+        """通知调度循环重新检查队列"""
+        self._wakeup.set()
+        self._publish_change()
+
+    def _publish_change(self):
+        """广播任务状态变化，唤醒所有等待中的监控方"""
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def wait_for_change(self):
+        """等待下一次任务状态变化"""
+        await self._changed.wait()
 
     async def start(self):
         """启动调度器"""
         if not self.scheduler_running:
             self.scheduler_running = True
             asyncio.create_task(self._scheduler_loop())
+            self._notify()  # 处理启动前已入队的任务
 
     async def stop(self):
         """停止调度器"""
         self.scheduler_running = False
+        self._notify()  # 唤醒调度循环使其退出
         # 取消所有运行中的任务
         for task in self.running_tasks.values():
             if not task.done():
@@ -108,20 +224,36 @@ class TaskScheduler:
 
     def add_task(self, task_id: str, priority: Priority, data: str) -> TaskItem:
         """添加任务到调度队列"""
-        task_item = TaskItem(task_id, priority, data, asyncio.get_event_loop().time())
+        task_item = TaskItem(task_id, priority, data, self._now())
         task_item.set_state(TaskState.READY)  # 任务添加时设置为READY状态
-        heapq.heappush(self.priority_queue, task_item)
+        self._push(task_item)
+        self._notify()
         return task_item
 
+    def _push(self, task_item: TaskItem):
+        """将任务项压入优先队列并登记索引"""
+        heapq.heappush(
+            self.priority_queue,
+            (
+                task_item.priority.value,
+                task_item.timestamp,
+                next(self._seq),
+                task_item,
+            ),
+        )
+        self.queued_tasks[task_item.task_id] = task_item
+
     def cancel_task(self, task_id: str) -> bool:
         """取消任务"""
         # 标记队列中的任务为已取消
-        for item in self.priority_queue:
-            if item.task_id == task_id:
-                item.cancelled = True
-                item.set_state(TaskState.CANCELED)
-                self.cancelled_tasks.add(task_id)
-                break
+        item = self.queued_tasks.get(task_id)
+        if item:
+            if not item.cancelled:
+                self._cancelled_in_queue += 1
+            item.cancelled = True
+            item.set_state(TaskState.CANCELED)
+            self.cancelled_tasks.add(task_id)
+            self._publish_change()
 
         # 取消正在运行的任务
         if task_id in self.running_tasks:
@@ -133,6 +265,7 @@ class TaskScheduler:
                 if task_data:
                     task_data.set_state(TaskState.CANCELED)
                 self.cancelled_tasks.add(task_id)
+                self._publish_change()
                 return True
 
         return task_id in self.cancelled_tasks
@@ -140,9 +273,7 @@ class TaskScheduler:
     def get_queue_status(self) -> Dict[str, Any]:
         """获取队列状态"""
         return {
-            "queue_size": len(
-                [item for item in self.priority_queue if not item.cancelled]
-            ),
+            "queue_size": len(self.queued_tasks) - self._cancelled_in_queue,
             "running_tasks": len(self.running_tasks),
             "completed_tasks": len(self.completed_tasks),
             "cancelled_tasks": len(self.cancelled_tasks),
@@ -160,24 +291,27 @@ class TaskScheduler:
                 if task_data:
                     task_data.set_state(TaskState.SUSPENDED)
                     # 将任务重新加入队列，等待恢复
-                    heapq.heappush(self.priority_queue, task_data)
+                    self._push(task_data)
                 del self.running_tasks[task_id]
+                self._publish_change()
                 return True
 
         # 挂起队列中的任务
-        for item in self.priority_queue:
-            if item.task_id == task_id and not item.cancelled:
-                item.set_state(TaskState.SUSPENDED)
-                return True
+        item = self.queued_tasks.get(task_id)
+        if item and not item.cancelled:
+            item.set_state(TaskState.SUSPENDED)
+            self._publish_change()
+            return True
 
         return False
 
     def resume_task(self, task_id: str) -> bool:
         """恢复挂起的任务"""
-        for item in self.priority_queue:
-            if item.task_id == task_id and item.state == TaskState.SUSPENDED:
-                item.set_state(TaskState.READY)
-                return True
+        item = self.queued_tasks.get(task_id)
+        if item and item.state is TaskState.SUSPENDED:
+            item.set_state(TaskState.READY)
+            self._notify()
+            return True
         return False
 
     def get_task_by_id(self, task_id: str) -> Optional[TaskItem]:
@@ -187,41 +321,36 @@ class TaskScheduler:
             task = self.running_tasks[task_id]
             return getattr(task, "_task_data", None)
 
-        # 检查队列中的任务
-        for item in self.priority_queue:
-            if item.task_id == task_id:
-                return item
-
-        # 检查已完成的任务（需要从completed_tasks中获取）
-        return None
+        # 检查队列中的任务（已完成的任务需要从 completed_tasks 中获取）
+        return self.queued_tasks.get(task_id)
 
     async def _scheduler_loop(self):
         """调度器主循环"""
         while self.scheduler_running:
-            await asyncio.sleep(0.1)  # 检查间隔
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if not self.scheduler_running:
+                break
 
             # 处理高优先级任务的打断逻辑
             if self.priority_queue:
-                next_task = self.priority_queue[0]
+                next_task = self.priority_queue[0][-1]
                 if not next_task.cancelled:
-                    await self._handle_priority_interruption(next_task)
+                    self._handle_priority_interruption(next_task)
 
             # 启动新任务
-            await self._start_pending_tasks()
+            self._start_pending_tasks()
 
-            # 清理已完成的任务
-            self._cleanup_completed_tasks()
-
-    async def _handle_priority_interruption(self, next_task: TaskItem):
+    def _handle_priority_interruption(self, next_task: TaskItem):
         """处理优先级打断逻辑"""
-        if next_task.priority == Priority.CRITICAL:
+        if next_task.priority is Priority.CRITICAL:
             # 关键任务可以打断所有其他任务
-            await self._interrupt_lower_priority_tasks(next_task.priority)
-        elif next_task.priority == Priority.HIGH and len(self.running_tasks) > 2:
+            self._interrupt_lower_priority_tasks(next_task.priority)
+        elif next_task.priority is Priority.HIGH and len(self.running_tasks) > 2:
             # 高优先级任务在有多个运行任务时可以打断低优先级任务
-            await self._interrupt_lower_priority_tasks(next_task.priority)
+            self._interrupt_lower_priority_tasks(next_task.priority)
 
-    async def _interrupt_lower_priority_tasks(self, priority: Priority):
+    def _interrupt_lower_priority_tasks(self, priority: Priority):
         """打断低优先级任务"""
         tasks_to_cancel = []
         for task_id, task in self.running_tasks.items():
@@ -233,29 +362,49 @@ class TaskScheduler:
         for task_id in tasks_to_cancel:
             self.cancel_task(task_id)
 
-    async def _start_pending_tasks(self):
-        """启动待处理的任务"""
+    def _start_pending_tasks(self):
+        """启动待处理的任务
+
+        只做同步的出队与 create_task，一次调用内把可启动的任务全部取出，
+        不在每个任务之间让出事件循环。
+        """
         max_concurrent = 3  # 最大并发任务数
+        queue = self.priority_queue
+        started = False
+
+        while queue and len(self.running_tasks) < max_concurrent:
+            task_item = queue[0][-1]
+            if task_item.cancelled:
+                # 已取消的任务直接出队丢弃，不再阻塞排在其后的任务
+                heapq.heappop(queue)
+                self.queued_tasks.pop(task_item.task_id, None)
+                self._cancelled_in_queue -= 1
+                continue
+            if not task_item.can_be_scheduled():
+                break
 
-        while (
-            len(self.running_tasks) < max_concurrent
-            and self.priority_queue
-            and not self.priority_queue[0].cancelled
-            and self.priority_queue[0].can_be_scheduled()
-        ):
-
-            task_item = heapq.heappop(self.priority_queue)
-            if not task_item.cancelled and task_item.can_be_scheduled():
-                # 设置任务状态为运行中
-                task_item.set_state(TaskState.RUNNING)
-                # 创建并启动任务
-                task = asyncio.create_task(self._execute_task(task_item))
-                task._task_data = task_item  # 附加任务数据
-                self.running_tasks[task_item.task_id] = task
+            heapq.heappop(queue)
+            self.queued_tasks.pop(task_item.task_id, None)
+            # 设置任务状态为运行中
+            task_item.set_state(TaskState.RUNNING)
+            # 创建并启动任务
+            task = asyncio.create_task(self._execute_task(task_item))
+            task._task_data = task_item  # 附加任务数据
+            # 任务结束（完成/取消/出错）时由回调移出 running_tasks 并唤醒调度循环
+            task.add_done_callback(
+                functools.partial(self._on_task_done, task_item.task_id)
+            )
+            self.running_tasks[task_item.task_id] = task
+            started = True
+
+        if started:
+            self._publish_change()
 
     async def _execute_task(self, task_item: TaskItem) -> Dict[str, Any]:
         """执行具体任务"""
         start_time = datetime.now()
+        # 耗时使用单调时钟计算，不受系统时间调整影响；start/end_time 仅用于展示
+        start_mono = time.monotonic()
         try:
             # 根据优先级设置不同的处理时间
             processing_time = {
@@ -278,6 +427,7 @@ class TaskScheduler:
                 "priority": task_item.priority.name,
                 "start_time": start_time.isoformat(),
                 "end_time": datetime.now().isoformat(),
+                "execution_time": round(time.monotonic() - start_mono, 3),
                 "result": f"处理完成: {task_item.data} (优先级: {task_item.priority.name})",
             }
 
@@ -296,6 +446,7 @@ class TaskScheduler:
                 "priority": task_item.priority.name,
                 "start_time": start_time.isoformat(),
                 "end_time": datetime.now().isoformat(),
+                "execution_time": round(time.monotonic() - start_mono, 3),
                 "result": f"任务被取消: {task_item.data}",
             }
             self.cancelled_tasks.add(task_item.task_id)
@@ -313,25 +464,24 @@ class TaskScheduler:
                 "priority": task_item.priority.name,
                 "start_time": start_time.isoformat(),
                 "end_time": datetime.now().isoformat(),
+                "execution_time": round(time.monotonic() - start_mono, 3),
                 "error": str(e),
             }
             return result
 
-    def _cleanup_completed_tasks(self):
-        """清理已完成的任务"""
-        completed_task_ids = []
-        for task_id, task in self.running_tasks.items():
-            if task.done():
-                completed_task_ids.append(task_id)
-
-        for task_id in completed_task_ids:
+    def _on_task_done(self, task_id: str, task: asyncio.Task):
+        """任务结束回调：移出运行表，空出的并发名额在下一轮调度即可使用"""
+        # 被挂起的任务已提前移出运行表，恢复后可能以同一 ID 重新运行，只删除本任务自己的条目
+        if self.running_tasks.get(task_id) is task:
             del self.running_tasks[task_id]
+        self._notify()
 
 
 class AsyncTaskManager:
     def __init__(self):
         self.tasks: Dict[str, Any] = {}
-        self.task_counter = 0
+        # 任务 ID 计数器，从 1 开始，next() 取号为原子操作
+        self._task_ids = itertools.count(1)
         self.scheduler = TaskScheduler()
 
     async def start_scheduler(self):
@@ -346,8 +496,7 @@ class AsyncTaskManager:
         self, task_data: str, priority: Priority = Priority.NORMAL
     ) -> str:
         """发送任务到调度器"""
-        self.task_counter += 1
-        task_id = f"task_{self.task_counter}"
+        task_id = f"task_{next(self._task_ids)}"
 
         # 存储任务信息
         self.tasks[task_id] = {
@@ -410,9 +559,9 @@ class AsyncTaskManager:
             task_item = self.scheduler.get_task_by_id(task_id)
             if task_item:
                 base_status["state"] = task_item.state.value
-                if task_item.state == TaskState.READY:
+                if task_item.state is TaskState.READY:
                     base_status["status"] = "queued"
-                elif task_item.state == TaskState.SUSPENDED:
+                elif task_item.state is TaskState.SUSPENDED:
                     base_status["status"] = "suspended"
 
         return base_status
@@ -430,9 +579,17 @@ class AsyncTerminalApp:
     def __init__(self):
         self.task_manager = AsyncTaskManager()
 
+        # 输出条目使用环形缓冲区保存，只保留最近的 MAX_OUTPUT_ENTRIES 条
+        self._output_entries = deque(maxlen=MAX_OUTPUT_ENTRIES)
+        self._output_entries.append(
+            "=== 智能任务调度终端 ===\n支持优先级调度和打断机制\n输入 'help' 查看帮助\n\n"
+        )
+        # 是否已安排一次渲染：同一轮事件循环内的多次输出合并为一次渲染
+        self._render_pending = False
+
         # 创建输出和输入区域
         self.output_area = TextArea(
-            text="=== 智能任务调度终端 ===\n支持优先级调度和打断机制\n输入 'help' 查看帮助\n\n",
+            text="".join(self._output_entries),
             read_only=True,
             scrollbar=True,
             wrap_lines=True,
@@ -451,6 +608,22 @@ class AsyncTerminalApp:
             ]
         )
 
+        # 命令分发表：无参数命令按整条输入（忽略大小写）匹配，带参数命令按命令名匹配
+        self._commands = {
+            "help": self._show_help,
+            "list": self._list_tasks,
+            "scheduler": self._show_scheduler_status,
+            "demo": self._run_demo,
+            "demo-states": self._run_state_demo,
+        }
+        self._arg_commands = {
+            "status": self._show_task_status,
+            "cancel": self._cancel_task,
+            "suspend": self._suspend_task,
+            "resume": self._resume_task,
+            "send": self._parse_send_command,
+        }
+
         # 创建键绑定
         self.kb = KeyBindings()
         self._setup_key_bindings()
@@ -474,7 +647,7 @@ class AsyncTerminalApp:
         @self.kb.add("c-l")
         def _(event):
             """Ctrl+L 清空输出"""
-            self.output_area.text = ""
+            self._clear_output()
 
     async def _handle_input(self):
         """处理用户输入"""
@@ -486,33 +659,18 @@ class AsyncTerminalApp:
 
         self._append_output(f"> {command}")
 
+        # 只做一次小写化和一次命令名/参数切分，随后查表分发
+        lowered = command.lower()
+        name, has_arg, arg = command.partition(" ")
+        arg = arg.strip()
+
         try:
-            if command.lower() == "help":
-                await self._show_help()
-            elif command.lower() == "list":
-                await self._list_tasks()
-            elif command.lower() == "clear":
-                self.output_area.text = ""
-            elif command.lower() == "scheduler":
-                await self._show_scheduler_status()
-            elif command.lower() == "demo":
-                await self._run_demo()
-            elif command.lower() == "demo-states":
-                await self._run_state_demo()
-            elif command.startswith("status "):
-                task_id = command[7:].strip()
-                await self._show_task_status(task_id)
-            elif command.startswith("cancel "):
-                task_id = command[7:].strip()
-                await self._cancel_task(task_id)
-            elif command.startswith("suspend "):
-                task_id = command[8:].strip()
-                await self._suspend_task(task_id)
-            elif command.startswith("resume "):
-                task_id = command[7:].strip()
-                await self._resume_task(task_id)
-            elif command.startswith("send "):
-                await self._parse_send_command(command[5:].strip())
+            if lowered == "clear":
+                self._clear_output()
+            elif lowered in self._commands:
+                await self._commands[lowered]()
+            elif has_arg and name in self._arg_commands:
+                await self._arg_commands[name](arg)
             else:
                 # 默认为普通优先级任务
                 await self._send_task(command, Priority.NORMAL)
@@ -521,39 +679,7 @@ class AsyncTerminalApp:
 
     async def _show_help(self):
         """显示帮助信息"""
-        help_text = """可用命令:
-- send <优先级> <任务内容>  : 发送指定优先级的任务
-  优先级: critical, high, normal, low
-  例如: send high 重要数据处理
-- <任务内容>               : 发送普通优先级任务
-- status <任务ID>          : 查看任务状态
-- cancel <任务ID>          : 取消任务
-- suspend <任务ID>         : 挂起任务
-- resume <任务ID>          : 恢复挂起的任务
-- list                    : 列出所有任务
-- scheduler               : 查看调度器状态
-- demo                    : 运行演示，创建各种优先级的示例任务
-- demo-states             : 运行状态演示，展示任务状态转换
-- clear                   : 清空输出
-- help                    : 显示此帮助
-- Ctrl+C                  : 退出程序
-
-优先级说明:
-- critical: 关键任务，会打断其他所有任务
-- high: 高优先级，在系统繁忙时可能打断低优先级任务
-- normal: 普通优先级 (默认)
-- low: 低优先级
-
-任务状态说明:
-- UNUSED: 默认初始化状态
-- READY: 准备就绪，等待调度
-- RUNNING: 正在运行
-- WAITING: 等待依赖任务完成
-- SUSPENDED: 已挂起，等待恢复
-- CANCELED: 已取消
-- COMPLETED: 已完成
-- ERROR: 出现错误"""
-        self._append_output(help_text)
+        self._append_output(HELP_TEXT)
 
     async def _parse_send_command(self, command_text: str):
         """解析send命令，提取优先级和任务内容"""
@@ -564,14 +690,7 @@ class AsyncTerminalApp:
             return
 
         priority_str, task_data = parts
-        priority_map = {
-            "critical": Priority.CRITICAL,
-            "high": Priority.HIGH,
-            "normal": Priority.NORMAL,
-            "low": Priority.LOW,
-        }
-
-        priority = priority_map.get(priority_str.lower())
+        priority = PRIORITY_BY_NAME.get(priority_str.lower())
         if priority is None:
             # 第一个词不是优先级，整个作为任务内容
             await self._send_task(command_text, Priority.NORMAL)
@@ -635,12 +754,7 @@ class AsyncTerminalApp:
     async def _show_scheduler_status(self):
         """显示调度器状态"""
         status = self.task_manager.get_scheduler_status()
-        status_text = f"""调度器状态:
-- 队列中任务: {status['queue_size']}
-- 运行中任务: {status['running_tasks']}
-- 已完成任务: {status['completed_tasks']}
-- 已取消任务: {status['cancelled_tasks']}"""
-        self._append_output(status_text)
+        self._append_output(SCHEDULER_STATUS_TEMPLATE.format(**status))
 
     async def _monitor_task(self, task_id: str):
         """监控任务状态并实时更新"""
@@ -648,7 +762,6 @@ class AsyncTerminalApp:
         last_state = None
 
         while True:
-            await asyncio.sleep(0.5)  # 更频繁的检查
             status_info = self.task_manager.get_task_status(task_id)
             current_status = status_info.get("status", "unknown")
             current_state = status_info.get("state", "UNKNOWN")
@@ -656,10 +769,13 @@ class AsyncTerminalApp:
             # 只在状态变化时输出
             if current_status != last_status or current_state != last_state:
                 if current_status == "running":
-                    priority = status_info.get("priority", "NORMAL")
-                    self._append_output(
-                        f"📋 任务 {task_id} 开始执行 (优先级: {priority}, 状态: {current_state})"
-                    )
+                    # 运行中被取消时 state 先于运行表变化，最终结果随后单独输出，
+                    # 这里只报告开始执行
+                    if last_status != "running":
+                        priority = status_info.get("priority", "NORMAL")
+                        self._append_output(
+                            f"📋 任务 {task_id} 开始执行 (优先级: {priority}, 状态: {current_state})"
+                        )
                 elif current_status == "completed":
                     result = status_info.get("result", "未知结果")
                     self._append_output(f"✅ 任务 {task_id} 已完成: {result}")
@@ -690,6 +806,9 @@ class AsyncTerminalApp:
             if current_status in ["completed", "cancelled", "failed", "not_found"]:
                 break
 
+            # 先检查再等待：首次状态立即输出，之后只在调度器广播状态变化时才重新检查
+            await self.task_manager.scheduler.wait_for_change()
+
     async def _show_task_status(self, task_id: str):
         """显示任务状态"""
         status = self.task_manager.get_task_status(task_id)
@@ -709,11 +828,12 @@ class AsyncTerminalApp:
         # 获取调度器状态
         scheduler_status = self.task_manager.get_scheduler_status()
 
-        self._append_output("=== 任务列表 ===")
-        self._append_output(
-            f"📊 队列: {scheduler_status['queue_size']} | 运行: {scheduler_status['running_tasks']} | 完成: {scheduler_status['completed_tasks']} | 取消: {scheduler_status['cancelled_tasks']}"
-        )
-        self._append_output("")
+        # 整个列表先收集成行，最后一次性写入输出
+        lines = [
+            "=== 任务列表 ===",
+            f"📊 队列: {scheduler_status['queue_size']} | 运行: {scheduler_status['running_tasks']} | 完成: {scheduler_status['completed_tasks']} | 取消: {scheduler_status['cancelled_tasks']}",
+            "",
+        ]
 
         # 按状态分组显示任务
         status_groups = {}
@@ -724,47 +844,27 @@ class AsyncTerminalApp:
                 status_groups[status] = []
             status_groups[status].append((task_id, task_info, current_status))
 
-        # 状态图标映射
-        status_icons = {
-            "queued": "⏳",
-            "running": "🔄",
-            "completed": "✅",
-            "cancelled": "❌",
-            "failed": "💥",
-            "suspended": "⏸️",
-        }
-
-        # 状态图标映射
-        state_icons = {
-            "UNUSED": "🔘",
-            "READY": "⏳",
-            "RUNNING": "🔄",
-            "WAITING": "⏱️",
-            "SUSPENDED": "⏸️",
-            "CANCELED": "❌",
-            "COMPLETED": "✅",
-            "ERROR": "💥",
-        }
-
         # 按优先级显示各状态的任务
         for status, tasks_list in status_groups.items():
             if tasks_list:
-                icon = status_icons.get(status, "❓")
-                self._append_output(f"{icon} {status.upper()}:")
+                icon = STATUS_ICONS.get(status, "❓")
+                lines.append(f"{icon} {status.upper()}:")
                 for task_id, task_info, current_status in tasks_list:
                     priority = task_info.get("priority", "NORMAL")
                     data = task_info.get("data", "")
                     state = current_status.get("state", "UNKNOWN")
-                    state_icon = state_icons.get(state, "❓")
+                    state_icon = STATE_ICONS.get(state, "❓")
                     created_time = (
                         task_info.get("created_at", "")[:19]
                         if task_info.get("created_at")
                         else ""
                     )
-                    self._append_output(
+                    lines.append(
                         f"  • {task_id} [{priority}] {state_icon} {state} - {data} ({created_time})"
                     )
-                self._append_output("")
+                lines.append("")
+
+        self._append_lines(lines)
 
     async def _run_demo(self):
         """运行演示，创建各种优先级的任务"""
@@ -779,22 +879,19 @@ class AsyncTerminalApp:
             (Priority.CRITICAL, "关键任务：安全检查"),
         ]
 
-        created_tasks = []
         for priority, task_data in demo_tasks:
             task_id = await self.task_manager.send_task(task_data, priority)
-            created_tasks.append(task_id)
             self._append_output(f"  📝 创建任务 {task_id}: {task_data}")
+            # 创建后立即开始监控，任务的状态变化随创建过程实时输出，
+            # 不必等全部任务创建完才一并开始
+            asyncio.create_task(self._monitor_task(task_id))
             await asyncio.sleep(0.5)  # 延迟创建，便于观察调度过程
 
-        self._append_output(f"✨ 演示完成！创建了 {len(created_tasks)} 个任务")
+        self._append_output(f"✨ 演示完成！创建了 {len(demo_tasks)} 个任务")
         self._append_output(
             "💡 使用 'list' 命令查看任务状态，'scheduler' 查看调度器状态"
         )
 
-        # 启动所有任务的监控
-        for task_id in created_tasks:
-            asyncio.create_task(self._monitor_task(task_id))
-
     async def _run_state_demo(self):
         """运行状态演示，展示任务状态转换"""
         self._append_output("🎭 开始状态演示 - 展示任务状态转换...")
@@ -834,10 +931,35 @@ class AsyncTerminalApp:
         timestamp = datetime.now().strftime("%H:%M:%S")
         new_text = f"[{timestamp}] {text}\n"
 
-        # 添加文本并滚动到底部
+        # 添加文本并滚动到底部（超出上限的最早输出会被丢弃）
+        self._output_entries.append(new_text)
+        self._schedule_render()
+
+    def _append_lines(self, lines: List[str]):
+        """批量添加多行输出，共用一个时间戳"""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._output_entries.extend(f"[{timestamp}] {line}\n" for line in lines)
+        self._schedule_render()
+
+    def _clear_output(self):
+        """清空输出"""
+        self._output_entries.clear()
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """安排在本轮事件循环末尾渲染一次输出"""
+        # 演示命令、任务状态广播等会连续输出多行，每行都整体重建文本代价随缓冲区增长
+        if not self._render_pending:
+            self._render_pending = True
+            asyncio.get_running_loop().call_soon(self._render_output)
+
+    def _render_output(self):
+        """将输出缓冲区渲染到输出区域"""
+        self._render_pending = False
+        text = "".join(self._output_entries)
         self.output_area.read_only = False
-        self.output_area.text += new_text
-        self.output_area.buffer.cursor_position = len(self.output_area.text)
+        self.output_area.text = text
+        self.output_area.buffer.cursor_position = len(text)
         self.output_area.read_only = True
 
     async def run(self):
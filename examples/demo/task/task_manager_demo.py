@@ -177,9 +177,9 @@ def main():
 
     try:
         print("调度器启动中...")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         scheduler.run()
-        elapsed = time.time() - start_time
+        elapsed = (time.monotonic_ns() - start_ns) / 1e9
         print(f"\n调度器已停止，运行时间: {elapsed:.2f}秒")
     except KeyboardInterrupt:
         print("\n程序被用户中断")
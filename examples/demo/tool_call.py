@@ -120,6 +120,10 @@ weather_tool_aws = {
 }
 
 
+# 工具名 -> 本地实现，按名称 O(1) 分发模型返回的工具调用
+TOOL_FUNCTIONS = {"get_weather": get_weather}
+
+
 def openai_tool_call_demo():
 
     model = Model(model_id="gpt-4o")
@@ -155,7 +159,9 @@ def openai_tool_call_demo():
 
             # Parse the arguments and call the appropriate function
             if tool_call.name == "get_weather":
-                args = json.loads(tool_call.arguments)
+                args = tool_call.arguments
+                if isinstance(args, str):
+                    args = json.loads(args)
                 weather_result = get_weather(**args)
 
                 # Add the tool response to messages
@@ -165,7 +171,7 @@ def openai_tool_call_demo():
                 messages.append(
                     tool(
                         tool_id=tool_call.id,
-                        content=json.dumps(weather_result),
+                        content=weather_result,
                     )
                 )
 
@@ -209,9 +215,9 @@ def deepseek_tool_call_demo():
         )
 
         for tool_call in response.tool_calls:
-            if tool_call.name == "get_weather":
-                args = tool_call.arguments
-                result = get_weather(**args)
+            func = TOOL_FUNCTIONS.get(tool_call.name)
+            if func:
+                result = func(**tool_call.arguments)
                 # 2. 把工具执行结果追加到 Context
                 ctx.tool(tool_id=tool_call.id, content=result)
 
@@ -1,32 +1,55 @@
 import inspect
 import functools
 import re
-from typing import Any, Dict, List, Optional, get_type_hints, Callable, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    get_args,
+    get_origin,
+    get_type_hints,
+    Callable,
+    Union,
+)
 from menglong.schemas.tool import ToolInfo, FunctionInfo
 
 
+# Python 类型 -> JSON Schema 类型
+_TYPE_MAP: Dict[Any, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    dict: "object",
+    Any: "string",  # 兜底
+}
+
+# Docstring 解析用正则：Args: 段落及其中的 "param_name: description" 行
+_ARGS_SECTION_RE = re.compile(r"Args:\s*(.*)", re.DOTALL | re.IGNORECASE)
+_PARAM_LINE_RE = re.compile(r"\s*(\w+):\s*(.*)")
+
+# inspect 哨兵与参数种类，装饰时逐参数比较，提前取出避免重复属性查找
+_EMPTY = inspect.Parameter.empty
+_VAR_KINDS = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+
 def _python_type_to_json_type(py_type: Any) -> str:
     """将 Python 类型转换为 JSON Schema 类型"""
-    type_map = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        list: "array",
-        dict: "object",
-        Any: "string",  # 兜底
-    }
+    # 常见的裸类型直接命中映射表
+    json_type = _TYPE_MAP.get(py_type)
+    if json_type is not None:
+        return json_type
 
     # 获取原始类型 (处理 Optional, Union 等)
-    origin = getattr(py_type, "__origin__", None)
-    if origin is Union:
+    if get_origin(py_type) is Union:
         # 取第一个非 None 类型
-        args = py_type.__args__
-        non_none = [a for a in args if a is not type(None)]
-        if non_none:
-            return _python_type_to_json_type(non_none[0])
+        for arg in get_args(py_type):
+            if arg is not type(None):
+                return _python_type_to_json_type(arg)
 
-    return type_map.get(py_type, "string")
+    return "string"
 
 
 def _parse_docstring(doc: str) -> Dict[str, str]:
@@ -36,35 +59,27 @@ def _parse_docstring(doc: str) -> Dict[str, str]:
         return param_descriptions
 
     # 查找 Args: 后的内容
-    args_section = re.search(r"Args:\s*(.*)", doc, re.DOTALL | re.IGNORECASE)
+    args_section = _ARGS_SECTION_RE.search(doc)
     if args_section:
         section_text = args_section.group(1)
         # 匹配 "param_name: description" 格式
-        matches = re.findall(r"\s*(\w+):\s*(.*)", section_text)
+        matches = _PARAM_LINE_RE.findall(section_text)
         for name, desc in matches:
-            # 清理换行和空白
-            param_descriptions[name] = desc.split("\n")[0].strip()
+            # "." 不跨行，desc 只含本行内容，去掉首尾空白即可
+            param_descriptions[name] = desc.strip()
 
     return param_descriptions
 
 
-def tool(func: Callable) -> Callable:
-    """
-    MengLong Tool 装饰器。
-    将一个普通的 Python 函数转换为具备自动导出 Schema 能力的工具对象。
-    """
-
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
-
+def _build_tool_info(func: Callable) -> ToolInfo:
+    """内省函数签名、类型注解与 Docstring，构造 ToolInfo"""
     # 获取内省信息
     sig = inspect.signature(func)
     type_hints = get_type_hints(func)
     doc_params = _parse_docstring(func.__doc__ or "")
 
     # 提取描述 (第一行作为总描述)
-    description = (func.__doc__ or "").strip().split("\n")[0]
+    description = (func.__doc__ or "").strip().partition("\n")[0]
 
     # 构造 Parameters Schema
     properties = {}
@@ -75,10 +90,7 @@ def tool(func: Callable) -> Callable:
         if param_name in ("self", "cls"):
             continue
         # 跳过 *args 和 **kwargs (目前简单实现)
-        if param.kind in (
-            inspect.Parameter.VAR_POSITIONAL,
-            inspect.Parameter.VAR_KEYWORD,
-        ):
+        if param.kind in _VAR_KINDS:
             continue
 
         py_type = type_hints.get(param_name, Any)
@@ -90,23 +102,49 @@ def tool(func: Callable) -> Callable:
         }
 
         # 判断是否必填 (无默认值)
-        if param.default is inspect.Parameter.empty:
+        if param.default is _EMPTY:
             required.append(param_name)
 
-    # 绑定 schema 方法
-    def schema() -> ToolInfo:
-        return ToolInfo(
-            function=FunctionInfo(
-                name=func.__name__,
-                description=description,
-                parameters={
-                    "type": "object",
-                    "properties": properties,
-                    "required": required,
-                },
-            )
+    return ToolInfo(
+        function=FunctionInfo(
+            name=func.__name__,
+            description=description,
+            parameters={
+                "type": "object",
+                "properties": properties,
+                "required": required,
+            },
         )
+    )
+
+
+def _get_tool_info(func: Callable) -> ToolInfo:
+    """获取函数的 ToolInfo：已是 @tool 工具时直接复用其定义，否则内省构造"""
+    tool_info = getattr(func, "tool_info", None)
+    if tool_info is None:
+        tool_info = _build_tool_info(func)
+    return tool_info
+
+
+def tool(func: Callable) -> Callable:
+    """
+    MengLong Tool 装饰器。
+    将一个普通的 Python 函数转换为具备自动导出 Schema 能力的工具对象。
+    """
+
+    # Schema 在装饰时一次性构造，Model 经 tool_info 属性直接复用这份共享定义
+    tool_info = _get_tool_info(func)
+
+    # 绑定 schema 方法：返回独立副本，调用方修改 parameters 等内容不会影响共享定义
+    def schema() -> ToolInfo:
+        return tool_info.model_copy(deep=True)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        return func(*args, **kwargs)
 
     wrapper.schema = schema
+    # 同时直接挂出 ToolInfo，调用方按属性读取即可，无需经过方法调用
+    wrapper.tool_info = tool_info
     wrapper.__is_menglong_tool__ = True
     return wrapper
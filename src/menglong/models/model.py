@@ -1,4 +1,5 @@
 from typing import List, Generator, Tuple, Optional, Dict, Any, Union, AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
 
 from menglong.schemas.chat import (
     Message,
@@ -61,18 +62,22 @@ class Model:
         self, messages: Union[Context, List[Union[Message, Dict[str, Any], str]]]
     ) -> List[Message]:
         """Ensure messages are Pydantic models"""
-        source_msgs = messages
+        # Context.add 已在写入时完成归一化与类型校验，只需浅拷贝列表，
+        # 避免调用方后续追加消息影响进行中的请求
         if isinstance(messages, Context):
-            source_msgs = messages.messages
-        elif not isinstance(messages, list):
+            return list(messages.messages)
+
+        source_msgs = messages
+        if not isinstance(messages, list):
             source_msgs = [messages]
 
         validated = []
         for msg in source_msgs:
-            if isinstance(msg, dict):
-                validated.append(Message(**msg))
-            elif isinstance(msg, Message):
+            # 最常见的是已构造好的 Message，放在最前面，多数消息只需一次类型判断
+            if isinstance(msg, Message):
                 validated.append(msg)
+            elif isinstance(msg, dict):
+                validated.append(Message(**msg))
             elif isinstance(msg, str):
                 validated.append(Message(role=MessageRole.USER, content=msg))
             else:
@@ -86,10 +91,11 @@ class Model:
 
         normalized = []
         for t in tools:
-            if callable(t) and hasattr(t, "schema"):
-                normalized.append(t.schema())
-            else:
-                normalized.append(t)
+            # @tool 函数在装饰时已挂上 ToolInfo，一次属性读取即可
+            info = getattr(t, "tool_info", None)
+            if info is None and callable(t) and hasattr(t, "schema"):
+                info = t.schema()
+            normalized.append(t if info is None else info)
         return normalized
 
     def chat(
@@ -187,13 +193,25 @@ class Model:
         else:
             configured_providers = []
 
-        for pname in configured_providers:
+        if not configured_providers:
+            return result
+
+        def fetch(pname: str) -> List[ModelInfo]:
+            if pname not in self._providers:
+                self._providers[pname] = ProviderRegistry.get_instance(
+                    pname, self.config
+                )
+            return self._providers[pname].list_models()
+
+        # 各 provider 的查询互不依赖且以网络 IO 为主，并发发出，总耗时取决于最慢的一个
+        with ThreadPoolExecutor(max_workers=len(configured_providers)) as pool:
+            futures = {
+                pname: pool.submit(fetch, pname) for pname in configured_providers
+            }
+
+        for pname, future in futures.items():
             try:
-                if pname not in self._providers:
-                    self._providers[pname] = ProviderRegistry.get_instance(
-                        pname, self.config
-                    )
-                result[pname] = self._providers[pname].list_models()
+                result[pname] = future.result()
             except Exception as e:
                 import warnings
 
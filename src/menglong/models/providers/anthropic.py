@@ -19,6 +19,11 @@ from menglong.schemas.model_info import ModelInfo
 from menglong.utils.config.config_type import ProviderConfig
 
 
+def _is_bedrock_model(model: str) -> bool:
+    """Bedrock 模型 ID：包含 anthropic. 或者以 us./global. 开头"""
+    return "anthropic." in model or model.startswith(("us.", "global."))
+
+
 @ProviderRegistry.register("anthropic")
 class AnthropicProvider(BaseProvider):
     """
@@ -39,10 +44,7 @@ class AnthropicProvider(BaseProvider):
         Bedrock 模型 ID 通常包含 'anthropic.' 且可能有 'us.' 或 'global.' 前缀。
         Native 模型 ID 通常是 'claude-x-y-...'
         """
-        # 判断标准：包含 anthropic. 或者以 us./global. 开头
-        is_bedrock = "anthropic." in model or model.startswith(("us.", "global."))
-
-        if is_bedrock:
+        if _is_bedrock_model(model):
             if not self._bedrock_client:
                 region = getattr(self.config, "region", None) or os.getenv(
                     "AWS_REGION", "us-west-2"
@@ -77,9 +79,7 @@ class AnthropicProvider(BaseProvider):
         """
         根据模型 ID 智能识别应使用的异步客户端类。
         """
-        is_bedrock = "anthropic." in model or model.startswith(("us.", "global."))
-
-        if is_bedrock:
+        if _is_bedrock_model(model):
             if not self._async_bedrock_client:
                 region = getattr(self.config, "region", None) or os.getenv(
                     "AWS_REGION", "us-west-1"
@@ -110,6 +110,12 @@ class AnthropicProvider(BaseProvider):
     # Anthropic / Bedrock 同步调用的 max_tokens 上限（超过此值 API 要求必须使用流式）
     _SYNC_MAX_TOKENS: int = 21000  # 安全上限（API 硬限 21332）
     _STREAM_MAX_TOKENS: int = 64000  # 流式模式的默认最大值
+    # OpenAI 风格 tool_choice 字符串 -> Anthropic tool_choice.type
+    _TOOL_CHOICE_TYPES: Dict[str, str] = {
+        "auto": "auto",
+        "any": "any",
+        "required": "any",
+    }
 
     def _convert_params(
         self, model: str, stream: bool = False, **kwargs
@@ -142,12 +148,9 @@ class AnthropicProvider(BaseProvider):
         if "tool_choice" in params:
             tc = params["tool_choice"]
             if isinstance(tc, str):
-                if tc.lower() == "required":
-                    params["tool_choice"] = {"type": "any"}
-                elif tc.lower() in ("auto", "any"):
-                    params["tool_choice"] = {"type": tc.lower()}
-            elif getattr(tc, "type", None) == "function":
-                pass
+                tc_type = self._TOOL_CHOICE_TYPES.get(tc.lower())
+                if tc_type:
+                    params["tool_choice"] = {"type": tc_type}
 
         return params
 
@@ -155,6 +158,18 @@ class AnthropicProvider(BaseProvider):
     #         生命周期钩子实现
     # ==========================================
 
+    @staticmethod
+    def _extract_system_prompt(messages: List[Message]) -> str:
+        """取第一条 system 消息作为 Anthropic 顶层 system 参数，没有则为空串"""
+        return next(
+            (
+                m.content
+                for m in messages
+                if (m.role.value if hasattr(m.role, "value") else m.role) == "system"
+            ),
+            "",
+        )
+
     def _convert_messages(self, messages: List[Message]) -> List[Dict[str, Any]]:
         """
         转换为 Anthropic Messages API 格式。
@@ -274,24 +289,25 @@ class AnthropicProvider(BaseProvider):
 
     def _normalize_response(self, response: Any, model: str) -> Response:
         """归一化响应（Native 与 Bedrock SDK 返回的消息对象结构一致）"""
-        text_content = ""
-        reasoning_content = ""
+        # 文本片段先收集再统一拼接，避免逐块 += 反复分配字符串
+        text_parts = []
+        reasoning_parts = []
         actions = []
         for block in response.content:
             if hasattr(block, "text"):
-                text_content += block.text
+                text_parts.append(block.text)
             elif hasattr(block, "type") and block.type == "thinking":
                 # Extended thinking block — capture reasoning text
-                reasoning_content += getattr(block, "thinking", "")
+                reasoning_parts.append(getattr(block, "thinking", ""))
             elif hasattr(block, "type") and block.type == "tool_use":
                 actions.append(
                     Action(id=block.id, name=block.name, arguments=block.input)
                 )
             elif isinstance(block, dict):
                 if block.get("type") == "text":
-                    text_content += block.get("text", "")
+                    text_parts.append(block.get("text", ""))
                 elif block.get("type") == "thinking":
-                    reasoning_content += block.get("thinking", "")
+                    reasoning_parts.append(block.get("thinking", ""))
                 elif block.get("type") == "tool_use":
                     actions.append(
                         Action(
@@ -301,6 +317,8 @@ class AnthropicProvider(BaseProvider):
                         )
                     )
 
+        text_content = "".join(text_parts)
+        reasoning_content = "".join(reasoning_parts)
         content_obj = Content(
             text=text_content if text_content else None,
             reasoning=reasoning_content if reasoning_content else None,
@@ -433,12 +451,7 @@ class AnthropicProvider(BaseProvider):
         if "tools" in params:
             params["tools"] = self._convert_tools(params["tools"])
 
-        system_prompt = ""
-        for m in messages:
-            role_val = m.role.value if hasattr(m.role, "value") else m.role
-            if role_val == "system":
-                system_prompt = m.content
-                break
+        system_prompt = self._extract_system_prompt(messages)
 
         response = client.messages.create(
             model=model,
@@ -458,12 +471,7 @@ class AnthropicProvider(BaseProvider):
         if "tools" in params:
             params["tools"] = self._convert_tools(params["tools"])
 
-        system_prompt = ""
-        for m in messages:
-            role_val = m.role.value if hasattr(m.role, "value") else m.role
-            if role_val == "system":
-                system_prompt = m.content
-                break
+        system_prompt = self._extract_system_prompt(messages)
 
         with client.messages.stream(
             model=model,
@@ -488,12 +496,7 @@ class AnthropicProvider(BaseProvider):
         if "tools" in params:
             params["tools"] = self._convert_tools(params["tools"])
 
-        system_prompt = ""
-        for m in messages:
-            role_val = m.role.value if hasattr(m.role, "value") else m.role
-            if role_val == "system":
-                system_prompt = m.content
-                break
+        system_prompt = self._extract_system_prompt(messages)
 
         response = await client.messages.create(
             model=model,
@@ -513,12 +516,7 @@ class AnthropicProvider(BaseProvider):
         if "tools" in params:
             params["tools"] = self._convert_tools(params["tools"])
 
-        system_prompt = ""
-        for m in messages:
-            role_val = m.role.value if hasattr(m.role, "value") else m.role
-            if role_val == "system":
-                system_prompt = m.content
-                break
+        system_prompt = self._extract_system_prompt(messages)
 
         async with client.messages.stream(
             model=model,
@@ -1,6 +1,8 @@
 from typing import List, Generator, Dict, Any, Optional, AsyncGenerator
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
 import boto3
-import json
 import os
 import base64
 
@@ -19,6 +21,7 @@ from menglong.schemas.chat import (
 )
 from menglong.schemas.model_info import ModelInfo
 from menglong.utils.config.config_type import ProviderConfig
+from menglong.utils.json_utils import loads
 
 
 @ProviderRegistry.register("aws")
@@ -32,6 +35,13 @@ class AWSProvider(BaseProvider):
     _SYNC_MAX_TOKENS: int = 21000   # 安全上限（API 硬限 21332）
     _STREAM_MAX_TOKENS: int = 64000 # 流式模式默认最大值
 
+    # boto3 converse 只有同步接口，异步调用投递到专用线程池，
+    # 避免并发请求挤占 asyncio 默认 executor。线程按需创建，类定义时建池即可
+    _IO_POOL_SIZE: int = 32
+    _io_pool: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=_IO_POOL_SIZE, thread_name_prefix="menglong-aws"
+    )
+
     def __init__(self, config: ProviderConfig):
         super().__init__(config)
         region = getattr(config, "region", None) or os.getenv("AWS_REGION", "us-west-2")
@@ -162,8 +172,8 @@ class AWSProvider(BaseProvider):
                             res = part.result
                             if isinstance(res, str):
                                 try:
-                                    res = json.loads(res)
-                                except:
+                                    res = loads(res)
+                                except ValueError:
                                     pass
 
                             if not isinstance(res, dict):
@@ -194,11 +204,11 @@ class AWSProvider(BaseProvider):
     def _normalize_response(self, response: Any, model: str) -> Response:
         """归一化 Bedrock 同步响应"""
         output_msg = response["output"]["message"]
-        text_content = ""
+        text_parts = []
         actions = []
         for part in output_msg.get("content", []):
             if "text" in part:
-                text_content += part["text"]
+                text_parts.append(part["text"])
             elif "toolUse" in part:
                 tu = part["toolUse"]
                 actions.append(
@@ -209,6 +219,7 @@ class AWSProvider(BaseProvider):
                     )
                 )
 
+        text_content = "".join(text_parts)
         content_obj = Content(text=text_content if text_content else None)
         output = Output(
             content=content_obj,
@@ -354,19 +365,43 @@ class AWSProvider(BaseProvider):
 
         response = self.client.converse_stream(**converse_stream_kwargs)
 
-        for event in response.get("stream"):
-            yield self._normalize_stream_chunk(event, model)
+        event_stream = response.get("stream")
+        try:
+            for event in event_stream:
+                yield self._normalize_stream_chunk(event, model)
+        finally:
+            # 消费方提前停止时也要释放底层 HTTP 连接
+            event_stream.close()
 
     async def async_chat(
         self, messages: List[Message], model: str, **kwargs
     ) -> Response:
-        """异步聊天接口"""
-        raise ValueError("boto3 converse api not support async,at now.")
-        pass
+        """异步聊天接口（在专用线程池中执行同步 converse 调用）"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_pool,
+            functools.partial(self.chat, messages, model, **kwargs),
+        )
 
     async def async_stream_chat(
         self, messages: List[Message], model: str, **kwargs
     ) -> AsyncGenerator[StreamResponse, None]:
-        """异步流式聊天接口"""
-        raise ValueError("boto3 converse api not support async,at now.")
-        pass
+        """异步流式聊天接口（逐块从专用线程池拉取同步流）"""
+        pool = self._io_pool
+        stream = self.stream_chat(messages, model, **kwargs)
+        done = object()
+        pending = None
+        try:
+            while True:
+                pending = pool.submit(next, stream, done)
+                chunk = await asyncio.wrap_future(pending)
+                if chunk is done:
+                    break
+                yield chunk
+        finally:
+            # 提前退出 (break/aclose/取消) 时关闭同步流；若 next 仍在线程中执行，
+            # 待其返回后再关闭，避免对正在运行的生成器调用 close
+            if pending is not None and not pending.done():
+                pending.add_done_callback(lambda _: pool.submit(stream.close))
+            else:
+                pool.submit(stream.close)
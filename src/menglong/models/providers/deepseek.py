@@ -1,6 +1,5 @@
 import os
-import json
-from typing import List, Generator, Dict, Any
+from typing import List, Dict, Any
 
 from menglong.models.providers.openai import OpenAIProvider
 from menglong.models.providers.registry import ProviderRegistry
@@ -9,12 +8,6 @@ from menglong.schemas.chat import (
     MessageRole,
     Response,
     StreamResponse,
-    Output,
-    Content,
-    Usage,
-    Action,
-    StreamOutput,
-    Delta,
 )
 from menglong.utils.config.config_type import ProviderConfig
 
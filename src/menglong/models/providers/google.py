@@ -18,6 +18,7 @@ from menglong.schemas.chat import (
 )
 from menglong.schemas.model_info import ModelInfo
 from menglong.utils.config.config_type import ProviderConfig
+from menglong.utils.json_utils import loads
 
 
 @ProviderRegistry.register("google")
@@ -176,8 +177,8 @@ class GoogleProvider(BaseProvider):
                             res = part.result
                             if isinstance(res, str):
                                 try:
-                                    res = json.loads(res)
-                                except:
+                                    res = loads(res)
+                                except ValueError:
                                     pass
 
                             if not isinstance(res, dict):
@@ -203,7 +204,7 @@ class GoogleProvider(BaseProvider):
 
     def _normalize_response(self, response: Any, model: str) -> Response:
         """归一化 Google GenAI 同步响应"""
-        text_content = ""
+        text_parts = []
         actions = []
 
         if response.candidates:
@@ -211,7 +212,7 @@ class GoogleProvider(BaseProvider):
             if candidate.content and candidate.content.parts:
                 for part in candidate.content.parts:
                     if hasattr(part, "text") and part.text:
-                        text_content += part.text
+                        text_parts.append(part.text)
                     elif hasattr(part, "function_call") and part.function_call:
                         actions.append(
                             Action(
@@ -221,6 +222,7 @@ class GoogleProvider(BaseProvider):
                             )
                         )
 
+        text_content = "".join(text_parts)
         content_obj = Content(text=text_content if text_content else None)
         output = Output(
             content=content_obj,
@@ -263,11 +265,16 @@ class GoogleProvider(BaseProvider):
         return StreamResponse(output=stream_output, model=model, usage=usage)
 
     def _convert_tools(self, tools: List[Any]) -> List[types.Tool]:
-        """将标准化工具转换为 Google GenAI 格式"""
-        functions = []
+        """将标准化工具转换为 Google GenAI 格式
+
+        函数工具合并为一个 types.Tool(function_declarations=...)，
+        其余原生工具 (如 types.Tool(google_search=...)) 原样追加在其后。
+        """
+        decls = []
+        other_tools = []
         for t in tools:
             if hasattr(t, "function"):
-                functions.append(
+                decls.append(
                     types.FunctionDeclaration(
                         name=t.function.name,
                         description=t.function.description,
@@ -275,18 +282,20 @@ class GoogleProvider(BaseProvider):
                     )
                 )
             elif isinstance(t, dict) and "function" in t:
-                functions.append(
+                func = t["function"]
+                decls.append(
                     types.FunctionDeclaration(
-                        name=t["function"]["name"],
-                        description=t["function"]["description"],
-                        parameters=t["function"]["parameters"],
+                        name=func["name"],
+                        description=func["description"],
+                        parameters=func["parameters"],
                     )
                 )
             else:
-                functions.append(t)
-        if functions:
-            return [types.Tool(function_declarations=functions)]
-        return []
+                other_tools.append(t)
+
+        google_tools = [types.Tool(function_declarations=decls)] if decls else []
+        google_tools.extend(other_tools)
+        return google_tools
 
     def list_models(self) -> List[ModelInfo]:
         """返回 Google GenAI 当前可用的模型列表（支持 generateContent 的）"""
@@ -341,32 +350,7 @@ class GoogleProvider(BaseProvider):
         # 处理工具转换 (MengLong Standard -> Google GenAI Spec)
         google_tools = None
         if "tools" in params:
-            decls = []
-            other_tools = []
-            for t in params.pop("tools"):
-                if hasattr(t, "function"):
-                    decls.append(
-                        types.FunctionDeclaration(
-                            name=t.function.name,
-                            description=t.function.description,
-                            parameters=t.function.parameters,
-                        )
-                    )
-                elif isinstance(t, dict) and "function" in t:
-                    decls.append(
-                        types.FunctionDeclaration(
-                            name=t["function"]["name"],
-                            description=t["function"]["description"],
-                            parameters=t["function"]["parameters"],
-                        )
-                    )
-                else:
-                    other_tools.append(t)
-
-            google_tools = []
-            if decls:
-                google_tools.append(types.Tool(function_declarations=decls))
-            google_tools.extend(other_tools)
+            google_tools = self._convert_tools(params.pop("tools"))
 
         system_instruction = None
         for m in messages:
@@ -424,32 +408,7 @@ class GoogleProvider(BaseProvider):
         # 处理工具转换 (MengLong Standard -> Google GenAI Spec)
         google_tools = None
         if "tools" in params:
-            decls = []
-            other_tools = []
-            for t in params.pop("tools"):
-                if hasattr(t, "function"):
-                    decls.append(
-                        types.FunctionDeclaration(
-                            name=t.function.name,
-                            description=t.function.description,
-                            parameters=t.function.parameters,
-                        )
-                    )
-                elif isinstance(t, dict) and "function" in t:
-                    decls.append(
-                        types.FunctionDeclaration(
-                            name=t["function"]["name"],
-                            description=t["function"]["description"],
-                            parameters=t["function"]["parameters"],
-                        )
-                    )
-                else:
-                    other_tools.append(t)
-
-            google_tools = []
-            if decls:
-                google_tools.append(types.Tool(function_declarations=decls))
-            google_tools.extend(other_tools)
+            google_tools = self._convert_tools(params.pop("tools"))
 
         system_instruction = None
         for m in messages:
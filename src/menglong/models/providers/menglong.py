@@ -1,5 +1,4 @@
-import json
-from typing import List, Generator, Dict, Any, Optional, AsyncGenerator
+from typing import List, Generator, Dict, Any, AsyncGenerator
 import os
 import httpx
 
@@ -9,14 +8,14 @@ from menglong.schemas.chat import (
     Message,
     Response,
     StreamResponse,
-    Output,
-    Content,
-    Usage,
-    Action,
-    StreamOutput,
-    Delta,
 )
 from menglong.utils.config.config_type import ProviderConfig
+from menglong.utils.json_utils import loads
+
+# SSE 数据行前缀与结束标记
+_SSE_PREFIX = "data: "
+_SSE_PREFIX_LEN = len(_SSE_PREFIX)
+_SSE_DONE = "[DONE]"
 
 
 @ProviderRegistry.register("menglong")
@@ -152,17 +151,17 @@ class MengLongProvider(BaseProvider):
         with self.client.stream("POST", "/chat", json=payload) as response:
             response.raise_for_status()
             for line in response.iter_lines():
-                if line.strip():
-                    # 处理 SSE 格式: "data: {...}"
-                    if line.startswith("data: "):
-                        data_str = line[6:]  # 移除 "data: " 前缀
-                        if data_str.strip() == "[DONE]":
-                            break
-                        try:
-                            chunk_data = json.loads(data_str)
-                            yield self._normalize_stream_chunk(chunk_data, model)
-                        except json.JSONDecodeError:
-                            continue
+                # 处理 SSE 格式: "data: {...}"，空行与其他字段直接跳过
+                if not line.startswith(_SSE_PREFIX):
+                    continue
+                data_str = line[_SSE_PREFIX_LEN:]
+                if data_str.strip() == _SSE_DONE:
+                    break
+                try:
+                    chunk_data = loads(data_str)
+                except ValueError:
+                    continue
+                yield self._normalize_stream_chunk(chunk_data, model)
 
     # ==========================================
     #         能力接口实现 (异步)
@@ -207,17 +206,17 @@ class MengLongProvider(BaseProvider):
         async with self.async_client.stream("POST", "/chat", json=payload) as response:
             response.raise_for_status()
             async for line in response.aiter_lines():
-                if line.strip():
-                    # 处理 SSE 格式: "data: {...}"
-                    if line.startswith("data: "):
-                        data_str = line[6:]  # 移除 "data: " 前缀
-                        if data_str.strip() == "[DONE]":
-                            break
-                        try:
-                            chunk_data = json.loads(data_str)
-                            yield self._normalize_stream_chunk(chunk_data, model)
-                        except json.JSONDecodeError:
-                            continue
+                # 处理 SSE 格式: "data: {...}"，空行与其他字段直接跳过
+                if not line.startswith(_SSE_PREFIX):
+                    continue
+                data_str = line[_SSE_PREFIX_LEN:]
+                if data_str.strip() == _SSE_DONE:
+                    break
+                try:
+                    chunk_data = loads(data_str)
+                except ValueError:
+                    continue
+                yield self._normalize_stream_chunk(chunk_data, model)
 
     def __del__(self):
         """清理资源"""
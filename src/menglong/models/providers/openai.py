@@ -1,4 +1,3 @@
-import json
 import warnings
 from typing import List, Generator, Dict, Any, Optional, AsyncGenerator
 
@@ -19,6 +18,7 @@ from menglong.schemas.chat import (
 )
 from menglong.schemas.model_info import ModelInfo
 from menglong.utils.config.config_type import ProviderConfig
+from menglong.utils.json_utils import dumps, loads
 
 
 @ProviderRegistry.register("openai")
@@ -57,8 +57,9 @@ class OpenAIProvider(BaseProvider):
 
             elif part_type == "image":
                 if getattr(part, "image_url", None):
+                    # 直接引用原字典，仅在需要补充 detail 时才复制（写时复制）
                     img_data = (
-                        part.image_url.copy()
+                        part.image_url
                         if isinstance(part.image_url, dict)
                         else {"url": part.image_url}
                     )
@@ -69,7 +70,7 @@ class OpenAIProvider(BaseProvider):
                     img_data = {}
                 detail = getattr(part, "detail", None)
                 if detail and "detail" not in img_data:
-                    img_data["detail"] = detail
+                    img_data = {**img_data, "detail": detail}
                 result.append({"type": "image_url", "image_url": img_data})
 
             elif part_type == "audio":
@@ -133,7 +134,7 @@ class OpenAIProvider(BaseProvider):
                 "function": {
                     "name": getattr(part, "name", ""),
                     "arguments": (
-                        json.dumps(part.arguments)
+                        dumps(part.arguments)
                         if isinstance(getattr(part, "arguments", None), dict)
                         else getattr(part, "arguments", "{}")
                     ),
@@ -239,10 +240,13 @@ class OpenAIProvider(BaseProvider):
         if choice.message.tool_calls:
             actions = []
             for tc in choice.message.tool_calls:
-                try:
-                    args = json.loads(tc.function.arguments)
-                except Exception:
-                    args = {"raw": tc.function.arguments}
+                args = tc.function.arguments
+                # 兼容网关：部分 OpenAI 兼容服务直接返回已解析的字典，无需再解析
+                if not isinstance(args, dict):
+                    try:
+                        args = loads(args)
+                    except Exception:
+                        args = {"raw": args}
                 actions.append(Action(id=tc.id, name=tc.function.name, arguments=args))
 
         # 提取思维推理内容（DeepSeek-thinking 、Infinigence thinking 等模型特有字段）
@@ -297,6 +301,14 @@ class OpenAIProvider(BaseProvider):
     #         能力接口（公开方法）
     # ==========================================
 
+    # Anthropic 风格 tool_choice.type -> OpenAI tool_choice 取值
+    _TOOL_CHOICE_TYPES: Dict[str, str] = {
+        "auto": "auto",
+        "none": "none",
+        "required": "required",
+        "any": "required",
+    }
+
     def _prepare_params(self, model: str, **kwargs) -> Dict[str, Any]:
         """预处理请求参数，统一转换 tools"""
         params = self._convert_params(model, **kwargs)
@@ -311,10 +323,8 @@ class OpenAIProvider(BaseProvider):
                 tc = params["tool_choice"]
                 if isinstance(tc, dict) and "type" in tc:
                     tc_type = tc["type"]
-                    if tc_type in ("auto", "none", "required"):
-                        params["tool_choice"] = tc_type
-                    elif tc_type == "any":
-                        params["tool_choice"] = "required"
+                    if tc_type in self._TOOL_CHOICE_TYPES:
+                        params["tool_choice"] = self._TOOL_CHOICE_TYPES[tc_type]
                     elif tc_type == "tool" and "name" in tc:
                         params["tool_choice"] = {
                             "type": "function",
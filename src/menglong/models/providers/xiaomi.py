@@ -1,4 +1,3 @@
-from typing import List, Generator, Dict, Any, Optional
 import os
 from menglong.models.providers.openai import OpenAIProvider
 from menglong.models.providers.registry import ProviderRegistry
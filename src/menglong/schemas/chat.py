@@ -14,6 +14,10 @@ from menglong.utils.multimodal_utils import (
     load_audio_from_path,
     load_video_from_path,
 )
+from menglong.utils.json_utils import dumps
+
+# 多模态参数中被视为远程 URL 的前缀
+_URL_PREFIXES = ("http://", "https://")
 
 # =========================
 #         Request
@@ -181,24 +185,28 @@ class Context(BaseModel):
             self.messages.append(Message(role=MessageRole.USER, content=message))
         elif isinstance(message, dict):
             self.messages.append(Message(**message))
-        else:
+        elif isinstance(message, Message):
             self.messages.append(message)
+        else:
+            raise ValueError(f"Invalid message type: {type(message)}")
         return self
 
+    # 以下快捷方法构造的一定是 Message，直接追加，跳过 add() 的类型归一化
+
     def user(self, content: Union[str, List], **kwargs):
-        self.add(User(content, **kwargs))
+        self.messages.append(User(content, **kwargs))
         return self
 
     def assistant(self, content: Optional[str] = None, **kwargs):
-        self.add(Assistant(content, **kwargs))
+        self.messages.append(Assistant(content, **kwargs))
         return self
 
     def system(self, content: str):
-        self.add(System(content))
+        self.messages.append(System(content))
         return self
 
-    def tool(self, tool_id: str, content: str, **kwargs):
-        self.add(Tool(tool_id, content, **kwargs))
+    def tool(self, tool_id: str, content: Any, **kwargs):
+        self.messages.append(Tool(tool_id, content, **kwargs))
         return self
 
     @property
@@ -259,7 +267,7 @@ def User(content: Union[str, List[Any]], **kwargs) -> Message:
         detail = kwargs.get("detail")  # OpenAI 特有参数
 
         if isinstance(val, str):
-            if val.startswith("http://") or val.startswith("https://"):
+            if val.startswith(_URL_PREFIXES):
                 # URL 格式
                 image_url = {"url": val}
                 if detail:
@@ -295,7 +303,7 @@ def User(content: Union[str, List[Any]], **kwargs) -> Message:
     if "audio" in kwargs:
         val = kwargs["audio"]
         if isinstance(val, str):
-            if val.startswith("http://") or val.startswith("https://"):
+            if val.startswith(_URL_PREFIXES):
                 # URL 格式
                 parts.append(AudioPart(audio_url=val))
             else:
@@ -313,7 +321,7 @@ def User(content: Union[str, List[Any]], **kwargs) -> Message:
     if "video" in kwargs:
         val = kwargs["video"]
         if isinstance(val, str):
-            if val.startswith("http://") or val.startswith("https://"):
+            if val.startswith(_URL_PREFIXES):
                 # URL 格式
                 parts.append(VideoPart(video_url=val))
             else:
@@ -387,17 +395,18 @@ def System(content: str) -> Message:
     return Message(role=MessageRole.SYSTEM, content=content)
 
 
-def Tool(tool_id: Any, content: str, **kwargs) -> Message:
+def Tool(tool_id: Any, content: Any, **kwargs) -> Message:
     """
     快捷构造 Tool 结果消息。
     tool_id 存储在 Outcome.id 中，Provider 在转换时从这里读取 tool_call_id。
     部分 Provider 内部会将其映射为 user 或特定 role。
+    content 可直接传入工具的原始返回值：字符串原样保留，其余对象序列化为 JSON。
     """
     parts = [
         Outcome(
             id=tool_id,
             name=kwargs.get("name"),
-            result=content,
+            result=content if isinstance(content, str) else dumps(content),
         )
     ]
     return Message(
@@ -1,7 +1,8 @@
+import copy
 import os
 import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import Dict, Optional, Tuple, Union
 
 import tomllib
 from menglong.utils.config.config_type import Config
@@ -11,6 +12,30 @@ CONFIG_FILENAMES = [
     ".configs.template.toml",  # For dev/fallback
 ]
 
+# Parsed TOML per config file: path -> ((mtime_ns, size), data).
+# Every Model() loads the config, so repeated constructions skip re-reading
+# and re-parsing an unchanged file; editing the file invalidates the entry.
+# The size is part of the key because coarse mtime resolution can miss an
+# edit made within the same timestamp tick.
+_TOML_CACHE: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+
+
+def _read_toml(path: Path) -> dict:
+    """Read a TOML file, reusing the parsed data while the file is unchanged.
+
+    Returns a deep copy: Config keeps nested values (extra fields, extra_fields
+    sub-dicts) by reference, so handing out the cached dict would let one
+    Model's config mutations leak into every later one.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _TOML_CACHE.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, "rb") as f:
+            cached = (key, tomllib.load(f))
+        _TOML_CACHE[path] = cached
+    return copy.deepcopy(cached[1])
+
 
 def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
     """Load configuration from a file or default locations"""
@@ -71,9 +96,7 @@ def load_config(config_path: Optional[Union[str, Path]] = None) -> Config:
         return Config()
 
     try:
-        with open(path_to_read, "rb") as f:
-            data = tomllib.load(f)
-        return Config(**data)
+        return Config(**_read_toml(path_to_read))
     except Exception as e:
         print(f"Warning: Failed to load config from {path_to_read}: {e}")
         return Config()
@@ -0,0 +1,87 @@
+"""
+JSON 序列化工具
+
+优先使用 orjson (C 实现，序列化/解析速度更快，可通过 `menglong[fast]` 安装)，
+未安装或 orjson 不支持的输入 (如超出 64 位的整数) 回退到标准库 json。
+
+无论走哪条路径，dumps 的输出约定一致：
+- 紧凑分隔符，非 ASCII 字符原样保留 (等价于 ensure_ascii=False)
+- 允许非字符串键 (转为字符串)
+- NaN / ±Infinity 输出为 null，保证结果是合法 JSON
+- datetime/date/time 输出为 ISO 8601 字符串，Enum 输出其 value，
+  dataclass 输出为对象，UUID 输出为字符串
+- 其他无法序列化的类型抛出 TypeError
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import math
+import uuid
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """标准库回退路径的类型扩展，与 orjson 原生支持的类型保持一致"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """将 NaN / ±Infinity 替换为 None (与 orjson 行为一致)"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(v) for v in obj]
+    return obj
+
+
+def _finite_default(obj: Any) -> Any:
+    return _replace_non_finite(_default(obj))
+
+
+def _std_dumps(obj: Any, default=_default) -> str:
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+        default=default,
+    )
+
+
+def dumps(obj: Any) -> str:
+    """将对象序列化为 JSON 字符串"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # 超出 64 位的整数等 orjson 不支持的输入，交给标准库处理
+            pass
+    try:
+        return _std_dumps(obj)
+    except ValueError:
+        # 含非有限浮点数：替换为 null 后重试，只有这种少见输入才多走一遍
+        return _std_dumps(_replace_non_finite(obj), _finite_default)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """将 JSON 字符串解析为 Python 对象，失败时抛出 ValueError (json.JSONDecodeError)"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
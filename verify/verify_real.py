@@ -1,6 +1,6 @@
-import traceback
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add src to path
@@ -10,11 +10,28 @@ from menglong.models.model import Model
 from menglong.utils.config.config_loader import load_config
 
 
+def report(result):
+    """输出单个模型的测试结果，result 为 Response 或捕获到的异常"""
+    if not isinstance(result, Exception):
+        print(f"✅ Success!")
+        print(f"Response: {result.text}")
+    # 如果是因为没配置 key 导致的，可以预期内失败
+    elif "missing" in str(result).lower() or "not found" in str(result).lower():
+        print(f"⚠️ Skipped: {result}")
+    else:
+        print(f"❌ Failed: {result}")
+
+
 def test_real_call():
     parser = argparse.ArgumentParser(description="MengLong Real API Verification")
     parser.add_argument(
         "--model", type=str, help="Specific model_id to test (provider/model)"
     )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Call all models at the same time (sync chat on a thread pool)",
+    )
     args = parser.parse_args()
 
     print("🚀 MengLong Real API Call Verification")
@@ -44,25 +61,32 @@ def test_real_call():
             # "menglong/global.anthropic.claude-sonnet-4-5-20250929-v1:0",
         ]
 
+    messages = [{"role": "user", "content": "Say :Hello Bro! print a picture"}]
+
+    if args.concurrent:
+        # 各模型的请求互不依赖，并发发出后按原顺序输出结果
+        with ThreadPoolExecutor(max_workers=len(test_models)) as pool:
+            futures = [
+                pool.submit(model.chat, messages, model_id)
+                for model_id in test_models
+            ]
+            for model_id, future in zip(test_models, futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+                print(f"\n--- Testing Model: {model_id} ---")
+                report(result)
+        return
+
     for model_id in test_models:
         print(f"\n--- Testing Model: {model_id} ---")
         try:
             print(f"Initiating request...")
-
-            messages = [{"role": "user", "content": "Say :Hello Bro! print a picture"}]
-
-            response = model.chat(messages, model_id)
-
-            print(f"✅ Success!")
-            print(f"Response: {response.text}")
-
+            result = model.chat(messages, model_id)
         except Exception as e:
-            # 如果是因为没配置 key 导致的，可以预期内失败
-            if "missing" in str(e).lower() or "not found" in str(e).lower():
-                print(f"⚠️ Skipped: {e}")
-            else:
-                print(f"❌ Failed: {e}")
-                # traceback.print_exc()
+            result = e
+        report(result)
 
 
 if __name__ == "__main__":
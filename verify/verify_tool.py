@@ -1,6 +1,5 @@
 import sys
 import argparse
-import json
 from pathlib import Path
 from typing import List, Dict, Any, Callable
 
@@ -59,39 +58,42 @@ class Calculator:
 # --- 2. 闭环执行逻辑 ---
 
 
-def run_loop(model: Model, model_id: str, prompt: str, tools: List[Callable]):
+def run_loop(
+    model: Model,
+    model_id: str,
+    prompt: str,
+    tools: List[Callable],
+    tool_map: Dict[str, Callable],
+):
     print(f"\n--- Round-trip Test on: {model_id} ---")
     print(f"User Query: {prompt}")
 
     # 使用 Context 管理对话状态
     ctx = Context().user(prompt)
 
-    # 建立工具映射表，用于执行
-    tool_map = {t.__name__: t for t in tools}
-
     # 第一步：获取工具调用建议
     response = model.chat(ctx, model=model_id, tools=tools)
+    tool_calls = response.tool_calls
+    text = response.text
     ctx.add(
         Assistant(
-            content=response.text,
-            tool_calls=[tc.model_dump() for tc in response.tool_calls]
-            if response.tool_calls
-            else None,
+            content=text,
+            tool_calls=[tc.model_dump() for tc in tool_calls] if tool_calls else None,
         )
     )
 
-    if response.tool_calls:
-        print(f"🛠️  Model suggested {len(response.tool_calls)} tool call(s).")
+    if tool_calls:
+        print(f"🛠️  Model suggested {len(tool_calls)} tool call(s).")
 
         # 执行工具
-        for tc in response.tool_calls:
+        for tc in tool_calls:
             print(f"   -> Calling {tc.name} with {tc.arguments}")
             func = tool_map.get(tc.name)
             if func:
                 result = func(**tc.arguments)
                 print(f"   <- Result: {result}")
                 # 将结果回传 (OpenAI/Anthropic 风格：需要 tool_use_id 对齐)
-                ctx.tool(tool_id=tc.id, content=json.dumps(result), name=tc.name)
+                ctx.tool(tool_id=tc.id, content=result, name=tc.name)
             else:
                 print(f"   ❌ Tool {tc.name} not found in map!")
 
@@ -100,7 +102,7 @@ def run_loop(model: Model, model_id: str, prompt: str, tools: List[Callable]):
         final_response = model.chat(ctx, model=model_id, tools=tools)
         print(f"✅ Final Summary: {final_response.text}")
     else:
-        print(f"✅ Direct Response: {response.text}")
+        print(f"✅ Direct Response: {text}")
 
 
 def test_tool_call():
@@ -111,6 +113,8 @@ def test_tool_call():
     model = Model()
     calc = Calculator(precision=4)
     tools = [get_weather, calc.add, Calculator.multiply]
+    # 工具映射表只建一次，所有模型和用例共用
+    tool_map = {t.__name__: t for t in tools}
 
     test_models = []
     if args.model:
@@ -130,9 +134,11 @@ def test_tool_call():
     for model_id in test_models:
         try:
             # 测试用例 1：计算
-            run_loop(model, model_id, "What is 1.23456 + 2.34567?", tools)
+            run_loop(model, model_id, "What is 1.23456 + 2.34567?", tools, tool_map)
             # 测试用例 2：天气
-            run_loop(model, model_id, "What's the weather like in Paris?", tools)
+            run_loop(
+                model, model_id, "What's the weather like in Paris?", tools, tool_map
+            )
         except Exception as e:
             if (
                 "missing" in str(e).lower()